@@ -9,7 +9,11 @@ import pytest
 from vcd.common import Timescale, TimescaleMagnitude, TimescaleUnit
 from vcd.writer import (
     CompoundVectorVariable,
+    EventVariable,
+    RealVariable,
+    ScalarVariable,
     ScopeType,
+    StringVariable,
     Variable,
     VCDPhaseError,
     VCDWriter,
@@ -100,6 +104,8 @@ def test_vcd_change_after_close(capsys):
     vcd.close()
     with pytest.raises(VCDPhaseError):
         vcd.change(var, 1, 1)
+    with pytest.raises(VCDPhaseError):
+        VCDWriter.change(vcd, var, 1, 1)
     with pytest.raises(VCDPhaseError):
         vcd.flush()
 
@@ -566,6 +572,27 @@ def test_vcd_real_var(capsys):
     assert lines[-len(expected_last) :] == expected_last
 
 
+@pytest.mark.parametrize(
+    'value, expected',
+    [
+        (0, 'r0 v'),
+        (-7, 'r-7 v'),
+        (2.0, 'r2 v'),
+        (-0.0, 'r-0 v'),
+        (0.1, 'r0.1 v'),
+        (1 / 3, 'r0.3333333333333333 v'),
+        (True, 'r1 v'),
+        ((1 << 53) - 1, 'r9007199254740991 v'),
+        ((1 << 53) + 1, 'r9007199254740992 v'),
+        (10**20, 'r1e+20 v'),
+        (1e20, 'r1e+20 v'),
+    ],
+)
+def test_real_var(value, expected):
+    var = RealVariable('v', 'real', 64, 0.0)
+    assert expected == var.format_value(value)
+
+
 def test_vcd_integer_var(capsys):
     with VCDWriter(sys.stdout, date='today') as vcd:
         v0 = vcd.register_var('aaa', 'nn0', 'integer', 16)
@@ -806,6 +833,48 @@ def test_variable():
         var.format_value(0)
 
 
+@pytest.mark.parametrize(
+    'var',
+    [
+        VectorVariable('v', 'integer', 8, 0),
+        CompoundVectorVariable('v', 'integer', (4, 4), (0, 0)),
+        ScalarVariable('v', 'wire', 1, 0),
+        RealVariable('v', 'real', 64, 0.0),
+        EventVariable('v', 'event', 1, True),
+        StringVariable('v', 'string', 1, ''),
+    ],
+)
+def test_variable_slots(var):
+    assert not hasattr(var, '__dict__')
+
+
+@pytest.mark.parametrize(
+    'value, expected',
+    [
+        (0, '0v'),
+        (1, '1v'),
+        (False, '0v'),
+        (True, '1v'),
+        (2, '1v'),
+        (0.0, '0v'),
+        ('X', 'Xv'),
+        ('Z', 'Zv'),
+        (None, 'zv'),
+    ],
+)
+def test_scalar_var(value, expected):
+    var = ScalarVariable('v', 'wire', 1, 'x')
+    assert expected == var.format_value(value)
+    assert 'xv' == var.dump_off()
+
+
+def test_scalar_var_invalid():
+    var = ScalarVariable('v', 'wire', 1, 'x')
+    with pytest.raises(ValueError):
+        var.format_value('01')
+    assert 'qv' == var.format_value('q', check=False)
+
+
 @pytest.mark.parametrize(
     'expected, unsigned, signed',
     [
@@ -835,6 +904,13 @@ def test_vector_var_3bit_invalid():
         var.format_value(-5)
 
 
+def test_vector_var_unchecked():
+    var = VectorVariable('v', 'integer', 16, 0)
+    assert var.format_value(1 << 16, check=False) == 'b10000000000000000 v'
+    with pytest.raises(ValueError):
+        var.format_value(1 << 16)
+
+
 @pytest.mark.parametrize(
     'size, value, expected',
     [
@@ -845,6 +921,8 @@ def test_vector_var_3bit_invalid():
         ((8, 4, 1), ('z', 'x', '-'), 'bzxxxx- v'),
         ((8, 4, 1), ('0', '1', None), 'b1z v'),
         ((8, 4, 1), (0xF, 0, 1), 'b111100001 v'),
+        ((8, 4, 1), (-1, -8, 0), 'b1111111110000 v'),
+        ((8, 4, 1), (True, 0, 'z'), 'b10000z v'),
         ((8, 4, 1), (None, 'x', None), 'bzxxxxz v'),
         ((8,), (1,), 'b1 v'),
         ((8, 32), (0b1010, 0xFF00FF00), 'b101011111111000000001111111100000000 v'),
@@ -856,7 +934,27 @@ def test_compound_vector(size, value, expected):
 
 
 @pytest.mark.parametrize(
-    'size, value', [((1, 2, 3), (0, 0)), ((1, 2, 3), (0, 0, 0, 0)), ((1,), (0, 0))]
+    'size, value, expected',
+    [
+        ((1, 2, 3), (0, 0, 8), 'b1000 v'),
+        ((1, 2, 3), (0, 8, 1), 'b1000001 v'),
+        ((1, 2, 3), (1, -4, 0), 'b100000 v'),
+    ],
+)
+def test_compound_vector_unchecked(size, value, expected):
+    var = CompoundVectorVariable('v', 'integer', size, None)
+    assert expected == var.format_value(value, check=False)
+
+
+@pytest.mark.parametrize(
+    'size, value',
+    [
+        ((1, 2, 3), (0, 0)),
+        ((1, 2, 3), (0, 0, 0, 0)),
+        ((1,), (0, 0)),
+        ((1, 2, 3), (0, 4, 0)),
+        ((1, 2, 3), (0, 0, -5)),
+    ],
 )
 def test_compound_vector_invalid_values(size, value):
     var = CompoundVectorVariable('v', 'integer', size, None)
@@ -68,6 +68,13 @@ class VCDWriter:
     :param int init_timestamp: The initial timestamp. default=0
     :raises ValueError: for invalid timescale values
 
+    .. Note::
+
+        Value changes are written to *file* as they occur, so many small writes are
+        made. For large dumps, open *file* with a generous buffer size (e.g.
+        ``open(path, 'w', buffering=1 << 20)``) to reduce the number of underlying
+        system calls.
+
     """
 
     def __init__(
@@ -99,9 +106,11 @@ class VCDWriter:
         self._scope_var_strs: Dict[ScopeTuple, List[str]] = {}
         self._scope_var_names: Dict[ScopeTuple, Set[str]] = {}
         self._scope_types: Dict[ScopeTuple, ScopeType] = {}
+        self._scope_tuples: Dict[str, ScopeTuple] = {}
         self._vars: List[Variable] = []
         self._timestamp = int(init_timestamp)
         self._last_dumped_ts: Optional[int] = None
+        self._dump_off_block: Optional[str] = None
 
     def set_scope_type(
         self, scope: ScopeInput, scope_type: Union[ScopeType, str]
@@ -277,12 +286,17 @@ class VCDWriter:
         if not self._dumping:
             return
         self._dump_timestamp()
-        self._ofile.write('$dumpoff\n')
-        for var in self._vars:
-            val_str = var.dump_off()
-            if val_str:
-                self._ofile.write(val_str + '\n')
-        self._ofile.write('$end\n')
+        if self._dump_off_block is None:
+            # The variables are fixed after registration and their dump_off() values
+            # do not depend on their current values, so the block is built once.
+            lines = ['$dumpoff']
+            for var in self._vars:
+                val_str = var.dump_off()
+                if val_str:
+                    lines.append(val_str)
+            lines.append('$end')
+            self._dump_off_block = '\n'.join(lines) + '\n'
+        self._ofile.write(self._dump_off_block)
         self._dumping = False
 
     def dump_on(self, timestamp: TimeValue) -> None:
@@ -297,12 +311,13 @@ class VCDWriter:
         self._dump_values('$dumpon')
 
     def _dump_values(self, keyword: str) -> None:
-        self._ofile.write(keyword + '\n')
+        lines = [keyword]
         for var in self._vars:
             val_str = var.dump(self._check_values)
             if val_str:
-                self._ofile.write(val_str + '\n')
-        self._ofile.write('$end\n')
+                lines.append(val_str)
+        lines.append('$end')
+        self._ofile.write('\n'.join(lines) + '\n')
 
     def _set_timestamp(self, timestamp: TimeValue) -> None:
         if timestamp < self._timestamp:
@@ -349,7 +364,7 @@ class VCDWriter:
             raise VCDPhaseError('Cannot change value after close()')
 
         # Format value early to catch any errors before writing output.
-        if value != var.value or var.type == VarType.event:
+        if value != var.value or isinstance(var, EventVariable):
             val_str = var.format_value(value, self._check_values)
         else:
             val_str = ''
@@ -376,7 +391,12 @@ class VCDWriter:
 
     def _get_scope_tuple(self, scope: ScopeInput) -> ScopeTuple:
         if isinstance(scope, str):
-            return tuple(scope.split(self._scope_sep))
+            # Many variables share a scope; split each scope string only once.
+            scope_tuple = self._scope_tuples.get(scope)
+            if scope_tuple is None:
+                scope_tuple = tuple(scope.split(self._scope_sep))
+                self._scope_tuples[scope] = scope_tuple
+            return scope_tuple
         if isinstance(scope, Sequence):
             return tuple(scope)
         else:
@@ -496,6 +516,7 @@ class VCDWriter:
         self._header_keywords.clear()
         self._scope_types.clear()
         self._scope_var_names.clear()
+        self._scope_tuples.clear()
 
 
 ValueType = TypeVar('ValueType')
@@ -527,6 +548,21 @@ class Variable(Generic[ValueType]):
         return None
 
 
+# State characters for the common scalar values. Note that False and True hash the
+# same as 0 and 1.
+_SCALAR_STATES: Dict[ScalarValue, str] = {
+    0: '0',
+    1: '1',
+    '0': '0',
+    '1': '1',
+    'x': 'x',
+    'X': 'X',
+    'z': 'z',
+    'Z': 'Z',
+    None: 'z',
+}
+
+
 class ScalarVariable(Variable[ScalarValue]):
     """One-bit VCD scalar.
 
@@ -545,6 +581,13 @@ class ScalarVariable(Variable[ScalarValue]):
         :returns: string representing value change for use in a VCD stream.
 
         """
+        try:
+            state = _SCALAR_STATES.get(value)
+        except TypeError:  # Unhashable value
+            state = None
+        if state is not None:
+            return state + self.ident
+
         if isinstance(value, str):
             if check and (len(value) != 1 or value not in '01xzXZ'):
                 raise ValueError(f'Invalid scalar value ({value})')
@@ -567,6 +610,8 @@ class EventVariable(Variable[EventValue]):
 
     """
 
+    __slots__ = ()
+
     def format_value(self, value: EventValue, check: bool = True) -> str:
         if value:
             return '1' + self.ident
@@ -613,6 +658,10 @@ class StringVariable(Variable[StringValue]):
         return f's{value_str} {self.ident}'
 
 
+# Magnitude bound for ints that are exactly representable as IEEE-754 doubles.
+_MAX_EXACT_INT = 1 << 53
+
+
 class RealVariable(Variable[RealValue]):
     """Real (IEEE-754 double-precision floating point) variable.
 
@@ -631,7 +680,15 @@ class RealVariable(Variable[RealValue]):
         :returns: string representing value change for use in a VCD stream.
 
         """
-        if not check or isinstance(value, Number):
+        # Exact type checks avoid the comparatively slow Number ABC check.
+        value_type = type(value)
+        if value_type is float:
+            return f'r{value:.16g} {self.ident}'
+        elif value_type is int and -_MAX_EXACT_INT < value < _MAX_EXACT_INT:
+            # Plain int formatting matches .16g for ints exactly representable as
+            # doubles, but avoids the int to float conversion.
+            return f'r{value} {self.ident}'
+        elif not check or isinstance(value, Number):
             return f'r{value:.16g} {self.ident}'
         else:
             raise ValueError(f'Invalid real value ({value})')
@@ -645,10 +702,16 @@ class VectorVariable(Variable[ScalarValue]):
 
     """
 
-    __slots__ = ()
+    __slots__ = ('_min_val', '_max_val')
 
     size: int
 
+    def __init__(self, ident: str, type: VarType, size: int, init: ScalarValue):
+        super().__init__(ident, type, size, init)
+        # Representable range is computed once rather than on every value change.
+        self._max_val = 1 << size
+        self._min_val = -(self._max_val >> 1)
+
     def format_value(self, value: ScalarValue, check: bool = True) -> str:
         """Format value change for VCD stream.
 
@@ -666,6 +729,15 @@ class VectorVariable(Variable[ScalarValue]):
             produce invalid VCD streams with invalid string values.
 
         """
+        if isinstance(value, int):
+            # Unroll for performance: _format_scalar_value(value, self.size, check)
+            if check and (value < self._min_val or value >= self._max_val):
+                raise ValueError(
+                    f'Value ({value}) not representable in {self.size} bits'
+                )
+            if value < 0:
+                value += self._max_val
+            return f'b{value:b} {self.ident}'
         value_str = _format_scalar_value(value, self.size, check)
         return f'b{value_str} {self.ident}'
 
@@ -681,10 +753,18 @@ class CompoundVectorVariable(Variable[CompoundValue]):
 
     """
 
-    __slots__ = ()
+    __slots__ = ('_limits',)
 
     size: CompoundSize
 
+    def __init__(
+        self, ident: str, type: VarType, size: CompoundSize, init: CompoundValue
+    ):
+        super().__init__(ident, type, size, init)
+        # Per-component (size, min, max) limits are computed once rather than on every
+        # value change.
+        self._limits = tuple((sz, -(1 << sz >> 1), 1 << sz) for sz in size)
+
     def format_value(self, value: CompoundValue, check: bool = True) -> str:
         """Format value change for VCD stream.
 
@@ -697,6 +777,18 @@ class CompoundVectorVariable(Variable[CompoundValue]):
             raise ValueError(
                 f'Compound value ({value}) must be length {len(self.size)}'
             )
+
+        # Fast path: when all components are representable ints, pack them into a
+        # single int and format that once. Anything else, including unrepresentable
+        # ints when not checking, takes the general path below.
+        packed = 0
+        for v, (size, min_val, max_val) in zip(value, self._limits):
+            if not isinstance(v, int) or v < min_val or v >= max_val:
+                break
+            packed = (packed << size) | (v + max_val if v < 0 else v)
+        else:
+            return f'b{packed:b} {self.ident}'
+
         # The string is built-up right-to-left in order to minimize/avoid left-extension
         # in the final value string.
         vstr_list: List[str] = []